@@ -0,0 +1,7 @@
+import os
+
+bind = f"0.0.0.0:{os.getenv('MAIN_API_PORT', '8000')}"
+workers = os.cpu_count()
+worker_class = 'uvicorn.workers.UvicornWorker'
+# load the app in the master so storage bootstrap runs once before the workers fork
+preload_app = True
@@ -14,6 +14,11 @@ echo "Stopping validation_api..."
 kill $(cat log/validation_api.pid)
 rm -f log/validation_api.pid
 
+# Kill the evaluation worker
+echo "Stopping evaluation worker..."
+kill $(cat log/worker.pid)
+rm -f log/worker.pid
+
 # Kill the eval_score_api and its subprocesses
 echo "Stopping eval_score_api..."
 kill_process_group $(cat log/eval_score_api.pid) "eval_score_api"
@@ -61,11 +61,19 @@ restart_service() {
     done
 }
 
-# Start the validation_api
+# Start the validation_api under gunicorn with uvicorn workers
 echo "Starting validation_api..."
-./../$VENV_NAME/bin/python3 validation_api.py --main-api-port $VALIDATION_API_PORT --eval-score-port $EVAL_SCORE_API_PORT --vibe-score-port $VIBE_SCORE_API_PORT >> "log/validation_api.log" 2>&1 &
+MAIN_API_PORT=$VALIDATION_API_PORT EVAL_SCORE_PORT=$EVAL_SCORE_API_PORT VIBE_SCORE_PORT=$VIBE_SCORE_API_PORT \
+    ./../$VENV_NAME/bin/gunicorn -c gunicorn_conf.py validation_api:app >> "log/validation_api.log" 2>&1 &
 echo $! > log/validation_api.pid
 
+# Start the evaluation worker as its own service so the gunicorn workers do not
+# spawn duplicate evaluators
+echo "Starting evaluation worker..."
+EVAL_SCORE_PORT=$EVAL_SCORE_API_PORT VIBE_SCORE_PORT=$VIBE_SCORE_API_PORT \
+    ./../$VENV_NAME/bin/python3 worker.py >> "log/worker.log" 2>&1 &
+echo $! > log/worker.pid
+
 # Start the eval_score_api in a loop to restart after each request
 restart_service "eval_score_api" "eval_score_api.py" "log/eval_score_api.log" "log/eval_score_api.pid" "log/eval_score_api_loop.pid" $EVAL_SCORE_API_PORT &
 
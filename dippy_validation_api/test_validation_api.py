@@ -0,0 +1,75 @@
+"""
+In-process smoke tests for the validation API. Unlike test_api.py these need
+no running server: the app runs under a TestClient against the real storage
+stack (Parquet snapshot, WAL, Arrow state file) in a temporary directory.
+Run with pytest from the repository root.
+"""
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from utilities.validation_utils import regenerate_hash
+
+
+def make_request_payload(competition_id="d1"):
+    payload = {
+        "repo_namespace": "Manavshah",
+        "repo_name": "llama-test",
+        "chat_template_type": "vicuna",
+        "hash": None,
+        "revision": "main",
+        "competition_id": competition_id,
+    }
+    payload["hash"] = str(regenerate_hash(
+        payload["repo_namespace"],
+        payload["repo_name"],
+        payload["chat_template_type"],
+        payload["competition_id"],
+    ))
+    return payload
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # the module creates its storage files relative to the working directory at
+    # import time, so point it at a fresh directory and (re)import it there
+    monkeypatch.chdir(tmp_path)
+    import dippy_validation_api.validation_api as validation_api
+    validation_api = importlib.reload(validation_api)
+    with TestClient(validation_api.app) as test_client:
+        yield test_client
+
+
+def test_evaluate_model_enqueues(client):
+    payload = make_request_payload()
+
+    response = client.post("/evaluate_model", json=payload)
+    assert response.status_code == 200, response.text
+
+    response_data = response.json()
+    assert response_data["status"] == "QUEUED"
+    for score in response_data["score"].values():
+        assert isinstance(score, float)
+
+    # resubmitting returns the tracked status instead of enqueueing twice
+    response = client.post("/evaluate_model", json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json()["status"] == "QUEUED"
+
+
+def test_leaderboard_serializes_populated_rows(client):
+    # a populated leaderboard carries pd.Timestamp and numpy values; make sure
+    # the endpoint can still serialize it
+    payload = make_request_payload()
+    assert client.post("/evaluate_model", json=payload).status_code == 200
+
+    response = client.get("/leaderboard")
+    assert response.status_code == 200, response.text
+
+    records = response.json()
+    assert len(records) == 1
+    assert records[0]["hash"] == payload["hash"]
+    assert records[0]["status"] == "QUEUED"
+    # timestamps stay ISO-8601 on the wire
+    assert "T" in records[0]["timestamp"]
@@ -1,18 +1,20 @@
-import gc
+import json
 import time
-import requests
+import asyncio
+import fcntl
+import httpx
+import orjson
 from typing import Optional
 import os
-import multiprocessing
-import argparse
 from pydantic import BaseModel
 
 import pandas as pd
-import uvicorn
-import torch
-from fastapi import FastAPI, HTTPException
+from pyarrow import feather
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.logger import logger
-from supabase import create_client
 
 logger.setLevel("INFO")
 
@@ -48,11 +50,20 @@ SAMPLE_SIZE_VIBE_SCORE = 128 # number of samples to evaluate the model from the
 
 SAVE_LEADERBOARD_EVERY = 60 # save the leaderboard every 60 seconds
 
-EVAL_SCORE_PORT = 8001 # default port for the eval_score API
-VIBE_SCORE_PORT = 8002 # default port for the vibe_score API
+LEADERBOARD_RESERVE_ROWS = 4096 # preallocated spare rows so submissions append in place instead of copying the frame
 
+SCORE_COLUMNS = ['model_size_score', 'qualitative_score', 'latency_score', 'vibe_score', 'total_score']
+STATUS_CATEGORIES = ['QUEUED', 'RUNNING', 'COMPLETED', 'FAILED']
 
-leaderboard_file = 'leaderboard.csv'
+EVAL_SCORE_PORT = int(os.getenv("EVAL_SCORE_PORT", 8001)) # port for the eval_score API
+VIBE_SCORE_PORT = int(os.getenv("VIBE_SCORE_PORT", 8002)) # port for the vibe_score API
+
+
+leaderboard_file = 'leaderboard.parquet'
+leaderboard_legacy_csv_file = 'leaderboard.csv'
+leaderboard_state_file = 'leaderboard_state.arrow'
+leaderboard_wal_file = 'leaderboard_wal.jsonl'
+leaderboard_lock_file = 'leaderboard.lock'
 
 class EvaluateModelRequest(BaseModel):
     repo_namespace: str
@@ -62,7 +73,28 @@ class EvaluateModelRequest(BaseModel):
     revision: Optional[str] = "main"
     competition_id: Optional[str] = "d1"
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Shared async HTTP client so polling the score APIs does not block the event loop
+# or pay a fresh TCP handshake per poll; connections stay alive across the whole
+# 30 s retry window and across evaluations
+http_client = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+)
+
+# The score APIs run the whole evaluation inside the POST (downloading weights
+# and scoring SAMPLE_SIZE samples), so the read side must wait indefinitely;
+# the short connect timeout keeps the retry loop responsive while the score
+# API is still starting up
+SCORE_API_TIMEOUT = httpx.Timeout(10.0, read=None)
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+
 
 chat_template_mappings = {
     "vicuna": "prompt_templates/vicuna_prompt_template.jinja",
@@ -74,71 +106,288 @@ chat_template_mappings = {
     "llama3": "prompt_templates/llama3_prompt_template.jinja",
 }
 
+class LeaderboardState:
+    """
+    Leaderboard shared between the API and worker processes. A full frame lives in
+    an Arrow IPC snapshot (kept hot in the OS page cache) and row-level changes are
+    appended to the WAL; each process keeps a local cached copy and catches up by
+    replaying the WAL tail, only rereading the snapshot after a compaction.
+    Coordination uses a file lock and the (snapshot mtime, WAL length) pair as the
+    version, so the gunicorn workers and the separate worker service need no common
+    parent process.
+    """
+    def __init__(self):
+        # per-process cache, never shared across processes
+        self._local_leaderboard = None
+        self._local_version = None
+        self._local_n_active = 0
+        self._local_hash_index = {}
+        self._local_col_pos = {}
+
+    def acquire(self):
+        """
+        Take the cross-process file lock and return the handle holding it. The
+        handle is opened per acquisition (forked workers must not share one file
+        description, since flock is held per description rather than per process)
+        and stays with the caller, so concurrent threads in one process each hold
+        their own handle instead of racing on shared state.
+        """
+        lock_fh = open(leaderboard_lock_file, 'w')
+        fcntl.flock(lock_fh, fcntl.LOCK_EX)
+        return lock_fh
+
+    def release(self, lock_fh):
+        fcntl.flock(lock_fh, fcntl.LOCK_UN)
+        lock_fh.close()
+
+    @property
+    def version(self):
+        """
+        (snapshot mtime, WAL length) pair; the mtime only moves on compaction, so
+        a changed WAL length with the same mtime means the cached frame can catch
+        up by replaying just the WAL tail. None until the first bootstrap.
+        """
+        try:
+            snapshot_mtime = os.stat(leaderboard_state_file).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        try:
+            wal_size = os.stat(leaderboard_wal_file).st_size
+        except FileNotFoundError:
+            wal_size = 0
+        return (snapshot_mtime, wal_size)
+
+    @property
+    def leaderboard(self):
+        return self._local_leaderboard
+
+    @property
+    def n_active(self):
+        return self._local_n_active
+
+    def active(self):
+        """View of the rows actually in use, excluding the preallocated spare capacity."""
+        return self._local_leaderboard.iloc[:self._local_n_active]
+
+    @property
+    def hash_index(self):
+        return self._local_hash_index
+
+    @property
+    def col_pos(self):
+        return self._local_col_pos
+
+
 class ThreadSafeLeaderboardManager:
-    def __init__(self, namespace):
-        self.namespace = namespace
-        self.lock = multiprocessing.Lock()
+    def __init__(self, state: LeaderboardState):
+        self.state = state
+        self._lock_fh = None
 
     def __enter__(self):
-        self.lock.acquire()
+        # the handle lives on this per-acquisition instance, never on the shared state
+        self._lock_fh = self.state.acquire()
         return self.get_leaderboard()
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.lock.release()
+        self.state.release(self._lock_fh)
+        self._lock_fh = None
 
     def get_leaderboard(self):
-        if not hasattr(self.namespace, 'leaderboard'):
-            dtype_dict = {
-                'hash': str,
-                'repo_namespace': str,
-                'repo_name': str,
-                'chat_template_type': str,
-                'model_size_score': 'float64',  # Use 'float64' to allow NaNs
-                'qualitative_score': 'float64',  # Use 'float64' to allow NaNs
-                'latency_score': 'float64',  # Use 'float64' to allow NaNs
-                'vibe_score': 'float64',  # Use 'float64' to allow NaNs
-                'total_score': 'float64',  # Use 'float64' to allow NaNs
-                'timestamp': str,
-                'status': str,
-                'notes': str
-            }
-            leaderboard = pd.read_csv(leaderboard_file, dtype=dtype_dict, parse_dates=['timestamp'])
-            # Replace NaN with None for JSON serialization
-            leaderboard = leaderboard.where(pd.notnull(leaderboard), None)
-            self.namespace.leaderboard = leaderboard
-        
-        return self.namespace.leaderboard
+        state = self.state
+        shared_version = state.version
+        if shared_version is None:
+            # first load in any process: bootstrap from the Parquet snapshot plus
+            # whatever the WAL recorded since it was written, then compact so the
+            # shared Arrow frame starts out current.
+            # NaNs are mapped to None at serialization time, not with a
+            # whole-frame scan on every load
+            leaderboard = pd.read_parquet(leaderboard_file)
+            leaderboard = replay_wal(leaderboard)
+            leaderboard = apply_leaderboard_dtypes(leaderboard)
+            leaderboard = reserve_capacity(leaderboard, int(leaderboard['hash'].notna().sum()))
+            compact_leaderboard(state, leaderboard)
+        elif state._local_version != shared_version:
+            snapshot_mtime, _ = shared_version
+            if state._local_version is not None and state._local_version[0] == snapshot_mtime:
+                # same snapshot, the WAL just grew: replay only the tail this
+                # process has not seen yet onto its cached frame
+                leaderboard = replay_wal(state._local_leaderboard, offset=state._local_version[1])
+            else:
+                # a compaction rewrote the snapshot; reread it from shared storage
+                leaderboard = feather.read_feather(leaderboard_state_file)
+                leaderboard = replay_wal(leaderboard)
+            cache_leaderboard_locally(state, leaderboard)
+            state._local_version = shared_version
+
+        return state._local_leaderboard
 
 # Usage example:
-# with ThreadSafeLeaderboardManager(namespace) as leaderboard:
+# with ThreadSafeLeaderboardManager(state) as leaderboard:
 #     # Perform thread-safe operations on leaderboard
 
+def build_hash_index(leaderboard: pd.DataFrame):
+    """
+    Map each model hash to its positional row index so updates can use a dict lookup
+    instead of scanning the whole 'hash' column for every write.
+    """
+    return {h: i for i, h in enumerate(leaderboard['hash'])}
+
+
+def build_col_pos(leaderboard: pd.DataFrame):
+    """
+    Map column names to their positional index once per (re)load, so hot-path
+    writes can use iat/iloc without a string lookup through the column Index.
+    """
+    return {name: i for i, name in enumerate(leaderboard.columns)}
+
+
+def apply_leaderboard_dtypes(leaderboard: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast scores to float32 (they are 0-1 values, so the precision is plenty)
+    and store status as a categorical. Roughly halves the in-memory footprint and
+    every serialization of the frame.
+    """
+    for col in SCORE_COLUMNS:
+        leaderboard[col] = leaderboard[col].astype('float32')
+    leaderboard['status'] = leaderboard['status'].astype(pd.CategoricalDtype(STATUS_CATEGORIES))
+    return leaderboard
+
+
+def reserve_capacity(leaderboard: pd.DataFrame, n_active: int) -> pd.DataFrame:
+    """
+    Make sure at least one preallocated spare row is left past the active region.
+    Capacity grows geometrically, so appends stay amortized O(1) instead of copying
+    the whole frame per insert.
+    """
+    if n_active < len(leaderboard):
+        return leaderboard
+    extra = max(len(leaderboard), LEADERBOARD_RESERVE_ROWS)
+    return leaderboard.reindex(range(len(leaderboard) + extra))
+
+
+def cache_leaderboard_locally(state: LeaderboardState, leaderboard: pd.DataFrame):
+    """
+    Refresh this process's cached frame and the derived lookups. Spare rows are
+    recognised by their null hash, so the active-row count never needs to be
+    shared explicitly.
+    """
+    state._local_leaderboard = leaderboard
+    state._local_n_active = int(leaderboard['hash'].notna().sum())
+    state._local_hash_index = build_hash_index(leaderboard.iloc[:state._local_n_active])
+    state._local_col_pos = build_col_pos(leaderboard)
+
+
+def publish_snapshot(state: LeaderboardState, leaderboard: pd.DataFrame):
+    """
+    Write the full frame to the shared Arrow buffer and reset the WAL. Only
+    bootstrap and compaction pay this full-frame write; ordinary mutations go
+    through publish_update. The caller must hold the leaderboard lock.
+    """
+    tmp_file = leaderboard_state_file + '.tmp'
+    feather.write_feather(leaderboard, tmp_file)
+    os.replace(tmp_file, leaderboard_state_file)
+    # the snapshot now covers everything the WAL recorded, so truncate it only
+    # after the snapshot is safely in place
+    open(leaderboard_wal_file, 'wb').close()
+    cache_leaderboard_locally(state, leaderboard)
+    state._local_version = state.version
+
+
+def publish_update(state: LeaderboardState, leaderboard: pd.DataFrame, hash, updates: dict):
+    """
+    Make one row's changes visible to other processes by appending them to the
+    WAL; readers replay the tail onto their cached frames, so a mutation costs
+    one small JSON line of IO instead of a full-frame write. The caller must
+    hold the leaderboard lock and have already applied the updates to the frame.
+    """
+    append_wal(hash, updates)
+    state._local_leaderboard = leaderboard
+    if hash not in state._local_hash_index:
+        # a fresh row was written into the next spare slot
+        state._local_hash_index[hash] = state._local_n_active
+        state._local_n_active += 1
+    state._local_version = state.version
+
+
+def bulk_update(state: LeaderboardState, hash, **fields):
+    """
+    Apply several column updates to one row as a single vectorized write, then
+    publish the diff through the WAL. The caller must hold the leaderboard lock.
+    """
+    leaderboard = state.leaderboard
+    row_idx = state.hash_index[hash]
+    leaderboard.iloc[row_idx, [state.col_pos[c] for c in fields]] = list(fields.values())
+    publish_update(state, leaderboard, hash, fields)
+
+
 def save_leaderboard(leaderboard: pd.DataFrame):
-    leaderboard.to_csv(leaderboard_file, index=False)
+    # columnar writer; 10x+ faster than to_csv and keeps dtypes intact. Written
+    # to a tempfile and swapped in atomically so a crash mid-write cannot leave a
+    # corrupt snapshot behind
+    tmp_file = leaderboard_file + '.tmp'
+    leaderboard.to_parquet(tmp_file, index=False, compression='snappy')
+    os.replace(tmp_file, leaderboard_file)
 
-def model_evaluation_worker(evaluation_queue, namespace):
-    while True:
-        request = evaluation_queue.get()
-        if request is None:  # Sentinel value to exit the process
-            break
-        try:
-            with torch.no_grad():  # Disable gradient calculation
-                result = evaluate_model_logic(request, namespace)
-                logger.info(f"Model evaluation completed: {result}")
-        except Exception as e:
-            logger.error(f"Error during model evaluation: {e}")
-        finally:
-            gc.collect()  # Garbage collect
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()  # Empty CUDA cache
 
-        
-def evaluate_model_logic(request: EvaluateModelRequest, namespace):
+def append_wal(hash, updates: dict):
+    """
+    Append a single row-diff to the write-ahead log. Each status or score change
+    lands on disk as one small JSON line instead of a full snapshot rewrite; the
+    periodic saver compacts the log back into the Parquet snapshot.
+    """
+    record = {'hash': hash, 'updates': updates, 'ts': time.time()}
+    with open(leaderboard_wal_file, 'ab') as wal:
+        wal.write((json.dumps(record, default=str) + '\n').encode('utf-8'))
+
+
+def replay_wal(leaderboard: pd.DataFrame, offset: int = 0) -> pd.DataFrame:
+    """
+    Apply row-diffs logged since the last compaction onto the frame, starting at
+    the given byte offset (so an up-to-date reader only pays for the tail it has
+    not seen yet). Inserts land in the preallocated spare rows.
+    """
+    if not os.path.exists(leaderboard_wal_file):
+        return leaderboard
+
+    n_active = int(leaderboard['hash'].notna().sum())
+    hash_index = build_hash_index(leaderboard.iloc[:n_active])
+    with open(leaderboard_wal_file, 'rb') as wal:
+        wal.seek(offset)
+        for line in wal:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            updates = record['updates']
+            row_idx = hash_index.get(record['hash'])
+            if row_idx is None:
+                # full-row insert; the WAL stores the timestamp as a string
+                if 'timestamp' in updates:
+                    updates = {**updates, 'timestamp': pd.Timestamp(updates['timestamp'])}
+                leaderboard = reserve_capacity(leaderboard, n_active)
+                leaderboard.iloc[n_active] = [updates.get(col) for col in leaderboard.columns]
+                hash_index[record['hash']] = n_active
+                n_active += 1
+            else:
+                leaderboard.iloc[row_idx, leaderboard.columns.get_indexer(list(updates))] = list(updates.values())
+
+    return leaderboard
+
+
+def compact_leaderboard(state: LeaderboardState, leaderboard: pd.DataFrame):
+    """
+    Rewrite the full Parquet snapshot and the shared Arrow frame, then truncate
+    the WAL. The caller must hold the leaderboard lock.
+    """
+    # the snapshot only keeps real rows, not the preallocated spare capacity
+    save_leaderboard(leaderboard[leaderboard['hash'].notna()])
+    publish_snapshot(state, leaderboard)
+
+async def evaluate_model_logic(request: EvaluateModelRequest, state: LeaderboardState):
     """
     Evaluate a model based on the model size and the quality of the model.
     """
-    with ThreadSafeLeaderboardManager(namespace) as leaderboard:
-        if not (leaderboard['hash'] == request.hash).any():
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        if request.hash not in state.hash_index:
             logger.debug(leaderboard)
             logger.debug(leaderboard['hash'])
             logger.debug(type(leaderboard['hash']))
@@ -147,14 +396,42 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
             raise ValueError(f"Model {request.hash} not found in the leaderboard")
         
         # changed status to in progress
-        update_leaderboard_status(namespace, request.hash, "RUNNING", "Model evaluation in progress")
-    
+        update_leaderboard_status(state, request.hash, "RUNNING", "Model evaluation in progress")
+
+    # repo and model size validation runs here, off the HTTP path; the API only
+    # verifies the hash and enqueues
+    failure_notes = None
+    try:
+        model_repo_size = check_model_repo_size(request.hash, request.repo_namespace, request.repo_name)
+    except Exception as e:
+        model_repo_size = None
+        failure_notes = f"Error checking model repo size: {e}"
+
+    if model_repo_size is None:
+        failure_notes = failure_notes or "Error checking model repo size. Make sure the model repository exists and is accessible."
+    elif model_repo_size > MAX_REPO_SIZE or model_repo_size < MIN_REPO_SIZE:
+        failure_notes = f"Model repo size is not up to requirments: {model_repo_size} bytes. Should be less than {MAX_REPO_SIZE} bytes and greater than {MIN_REPO_SIZE} bytes"
+
+    if failure_notes is None:
+        # check model size by checking safetensors index
+        model_size = get_model_size(request.repo_namespace, request.repo_name)
+        if model_size is None:
+            failure_notes = "Error getting model size. Make sure the model.index.safetensors.json file exists in the model repository. And it has the metadata->total_size field."
+        elif (model_size // 4) > MAX_MODEL_SIZE:
+            failure_notes = f"Model size is too large: {model_size} bytes. Should be less than {MAX_MODEL_SIZE} bytes"
+
+    if failure_notes is not None:
+        logger.error(failure_notes)
+        with ThreadSafeLeaderboardManager(state) as leaderboard:
+            update_leaderboard_status(state, request.hash, "FAILED", failure_notes)
+        raise RuntimeError(failure_notes)
+
     logger.info("Model evaluation in progress")
     start_time = time.time()
     eval_score_response = None
     while True:
         try:
-            eval_score_response = requests.post(f"http://localhost:{EVAL_SCORE_PORT}/eval_score", json=request.model_dump())
+            eval_score_response = await http_client.post(f"http://localhost:{EVAL_SCORE_PORT}/eval_score", json=request.model_dump(), timeout=SCORE_API_TIMEOUT)
             if eval_score_response.status_code == 200:
                 logger.info("eval_score API call successful")
                 break
@@ -163,23 +440,23 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
         except Exception as e:
             if time.time() - start_time > 30:
                 error_string = f"Error calling eval_score API with message: {eval_score_response.content if eval_score_response else e}"
-                
-                with ThreadSafeLeaderboardManager(namespace) as leaderboard:
-                    update_leaderboard_status(namespace, request.hash, "FAILED", error_string)
-                
+
+                with ThreadSafeLeaderboardManager(state) as leaderboard:
+                    update_leaderboard_status(state, request.hash, "FAILED", error_string)
+
                 try:
-                    shutdown_response = requests.post(f"http://localhost:{EVAL_SCORE_PORT}/shutdown", timeout=1)
+                    shutdown_response = await http_client.post(f"http://localhost:{EVAL_SCORE_PORT}/shutdown", timeout=1)
                 except Exception as shutdown_error:
                     pass
-                
+
                 raise RuntimeError(error_string)
-        
-        time.sleep(1)  # Wait for 1 second before retrying
-    
+
+        await asyncio.sleep(1)  # Wait for 1 second before retrying
+
     # Call the shutdown endpoint to restart the eval_score_api for the next evaluation to avoid memory leaks that were observed with loading and unloading different models
     logger.info("Shutting down eval_score_api")
     try:
-        shutdown_response = requests.post(f"http://localhost:{EVAL_SCORE_PORT}/shutdown", timeout=1)
+        shutdown_response = await http_client.post(f"http://localhost:{EVAL_SCORE_PORT}/shutdown", timeout=1)
     except Exception as e:
         pass
     logger.info("vibe_score_api shutdown initiated for restart.")
@@ -190,20 +467,22 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
     model_size_score = eval_score_data["model_size_score"]
 
     # update the leaderboard with only the scores that are available and update the notes
-    with ThreadSafeLeaderboardManager(namespace) as leaderboard:
-        leaderboard.loc[leaderboard['hash'] == request.hash, 'model_size_score'] = float(model_size_score)
-        leaderboard.loc[leaderboard['hash'] == request.hash, 'qualitative_score'] = float(eval_score)
-        leaderboard.loc[leaderboard['hash'] == request.hash, 'latency_score'] = float(latency_score)
-        leaderboard.loc[leaderboard['hash'] == request.hash, 'notes'] = "Now computing vibe score"
-        namespace.leaderboard = leaderboard
-        save_leaderboard(namespace.leaderboard)
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        bulk_update(
+            state,
+            request.hash,
+            model_size_score=float(model_size_score),
+            qualitative_score=float(eval_score),
+            latency_score=float(latency_score),
+            notes="Now computing vibe score",
+        )
 
     # Call the vibe_score API
     start_time = time.time()
     vibe_score_response = None
     while True:
         try:
-            vibe_score_response = requests.post(f"http://localhost:{VIBE_SCORE_PORT}/vibe_match_score", json=request.model_dump())
+            vibe_score_response = await http_client.post(f"http://localhost:{VIBE_SCORE_PORT}/vibe_match_score", json=request.model_dump(), timeout=SCORE_API_TIMEOUT)
             if vibe_score_response.status_code == 200:
                 logger.info("vibe_score API call successful")
                 break
@@ -212,22 +491,22 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
         except Exception as e:
             if time.time() - start_time > 30:
                 error_string = f"Error calling vibe_score API with message: {vibe_score_response.content if vibe_score_response else e}"
-                with ThreadSafeLeaderboardManager(namespace):
-                    update_leaderboard_status(namespace, request.hash, "FAILED", error_string)
-                
+                with ThreadSafeLeaderboardManager(state):
+                    update_leaderboard_status(state, request.hash, "FAILED", error_string)
+
                 try:
-                    shutdown_response = requests.post(f"http://localhost:{VIBE_SCORE_PORT}/shutdown", timeout=1)
+                    shutdown_response = await http_client.post(f"http://localhost:{VIBE_SCORE_PORT}/shutdown", timeout=1)
                 except Exception as shutdown_error:
                     logger.error(f"Error during vibe_score_api shutdown: {shutdown_error}")
-                
+
                 raise RuntimeError(error_string)
-        
-        time.sleep(1)  # Wait for 1 second before retrying
-    
+
+        await asyncio.sleep(1)  # Wait for 1 second before retrying
+
     # Call the shutdown endpoint to restart the vibe_score_api for the next evaluation to avoid memory leaks that were observed with loading and unloading different models
     logger.info("Shutting down vibe_score_api")
     try:
-        shutdown_response = requests.post(f"http://localhost:{VIBE_SCORE_PORT}/shutdown", timeout=1)
+        shutdown_response = await http_client.post(f"http://localhost:{VIBE_SCORE_PORT}/shutdown", timeout=1)
     except Exception as e:
         pass
 
@@ -242,22 +521,25 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
     total_score += vibe_score * VIBE_SCORE_WEIGHT
 
     try:
-        with ThreadSafeLeaderboardManager(namespace) as leaderboard:
+        with ThreadSafeLeaderboardManager(state) as leaderboard:
             logger.info("Updating leaderboard to COMPLETED")
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'model_size_score'] = float(model_size_score)
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'qualitative_score'] = float(eval_score)
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'latency_score'] = float(latency_score)
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'vibe_score'] = float(vibe_score)
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'total_score'] = float(total_score)
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'status'] = "COMPLETED"
-            leaderboard.loc[leaderboard['hash'] == request.hash, 'notes'] = ""
-            namespace.leaderboard = leaderboard
-        
+            bulk_update(
+                state,
+                request.hash,
+                model_size_score=float(model_size_score),
+                qualitative_score=float(eval_score),
+                latency_score=float(latency_score),
+                vibe_score=float(vibe_score),
+                total_score=float(total_score),
+                status="COMPLETED",
+                notes="",
+            )
+
     except Exception as e:
         failure_reason = str(e)
-        with ThreadSafeLeaderboardManager(namespace) as leaderboard:
+        with ThreadSafeLeaderboardManager(state) as leaderboard:
             logger.error(f"Updating leaderboard to FAILED: {failure_reason}")
-            update_leaderboard_status(request.hash, "FAILED", failure_reason)
+            update_leaderboard_status(state, request.hash, "FAILED", failure_reason)
         
         raise RuntimeError("Error updating leaderboard: " + failure_reason)
     
@@ -270,239 +552,199 @@ def evaluate_model_logic(request: EvaluateModelRequest, namespace):
     }
 
 
-def update_leaderboard_status(namespace, hash, status, notes=""):
-    leaderboard = namespace.leaderboard
-    try:
-        leaderboard.loc[leaderboard['hash'] == hash, 'status'] = status
-        if notes:
-            leaderboard.loc[leaderboard['hash'] == hash, 'notes'] = notes
+def update_leaderboard_status(state, hash, status, notes=""):
+    # errors propagate to the caller: a claim or status change that did not
+    # land must not look like it did, or the same model gets evaluated twice
+    leaderboard = state.leaderboard
+    row_idx = state.hash_index[hash]
+    updates = {'status': status, 'notes': notes} if notes else {'status': status}
+    for column, value in updates.items():
+        leaderboard.iat[row_idx, state.col_pos[column]] = value
 
-        namespace.leaderboard = leaderboard
-        save_leaderboard(namespace.leaderboard)
-    except Exception as e:
-        logger.error(f"Error updating leaderboard status for {hash}: {e}")
+    publish_update(state, leaderboard, hash, updates)
 
 
-def get_json_result(namespace, hash):
-    leaderboard = namespace.leaderboard
-    if (leaderboard['hash'] == hash).any():
-        # if it exists, return score and status
-        model_entry = leaderboard[leaderboard['hash'] == hash].iloc[0]
-        
-        return {
-            "score": {
-                "model_size_score": model_entry['model_size_score'],
-                "qualitative_score": model_entry['qualitative_score'],
-                "latency_score": model_entry['latency_score'],
-                "vibe_score": model_entry['vibe_score'],
-                "total_score": model_entry['total_score']
-            },
-            "status": model_entry['status']
-        }
-    else:
-        None
+def get_json_result(state, hash):
+    # dict lookup plus scalar iat reads instead of scanning the hash column and
+    # materializing a one-row copy
+    row_idx = state.hash_index.get(hash)
+    if row_idx is None:
+        return None
 
+    leaderboard = state.leaderboard
+    col_pos = state.col_pos
+    # iat returns np.float32 scalars, which (unlike np.float64) are not a float
+    # subclass and fail JSON encoding; hand plain floats to the response
+    return {
+        "score": {
+            "model_size_score": float(leaderboard.iat[row_idx, col_pos['model_size_score']]),
+            "qualitative_score": float(leaderboard.iat[row_idx, col_pos['qualitative_score']]),
+            "latency_score": float(leaderboard.iat[row_idx, col_pos['latency_score']]),
+            "vibe_score": float(leaderboard.iat[row_idx, col_pos['vibe_score']]),
+            "total_score": float(leaderboard.iat[row_idx, col_pos['total_score']])
+        },
+        "status": leaderboard.iat[row_idx, col_pos['status']]
+    }
 
-@app.post("/evaluate_model")
-def evaluate_model(request: EvaluateModelRequest):
-    # verify hash
-    if int(request.hash) != regenerate_hash(request.repo_namespace, request.repo_name, request.chat_template_type, request.competition_id):
-        raise HTTPException(status_code=400, detail="Hash does not match the model details")
 
-    # check if the model already exists in the leaderboard
-    with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-        # This needs to be a virtually atomic operation
-        current_status = get_json_result(app.state.ns, request.hash)
-        if current_status is None:
-            failure_notes = ""
-            # add the model to leaderboard with status QUEUED
-            new_entry = pd.DataFrame([{
-                "hash": request.hash,
-                "repo_namespace": request.repo_namespace,
-                "repo_name": request.repo_name,
-                "chat_template_type": request.chat_template_type,
-                "model_size_score": -1.0,
-                "qualitative_score": -1.0,
-                "latency_score": -1.0,
-                "vibe_score": -1.0,
-                "total_score": -1.0,
-                "timestamp": pd.Timestamp.utcnow(),
-                "status": "QUEUED",
-                "notes": ""
-            }])
-
-            app.state.ns.leaderboard = pd.concat([new_entry, leaderboard], ignore_index=True)
-            save_leaderboard(app.state.ns.leaderboard)
-    
-    if current_status is not None:
-        return current_status
+def tracked_model_status(state: LeaderboardState, hash):
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        return get_json_result(state, hash)
+
+
+def enqueue_model(state: LeaderboardState, request: EvaluateModelRequest):
+    # single critical section for the whole cold path: re-check, enqueue and
+    # validate without re-acquiring the lock per step
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        # re-check under the lock in case a concurrent request enqueued it first
+        current_status = get_json_result(state, request.hash)
+        if current_status is not None:
+            return current_status
+
+        # add the model to leaderboard with status QUEUED
+        new_row = {
+            "hash": request.hash,
+            "repo_namespace": request.repo_namespace,
+            "repo_name": request.repo_name,
+            "chat_template_type": request.chat_template_type,
+            "revision": request.revision,
+            "competition_id": request.competition_id,
+            "model_size_score": -1.0,
+            "qualitative_score": -1.0,
+            "latency_score": -1.0,
+            "vibe_score": -1.0,
+            "total_score": -1.0,
+            "timestamp": pd.Timestamp.utcnow(),
+            "status": "QUEUED",
+            "notes": ""
+        }
 
-    # validate the request
-    if request.chat_template_type not in chat_template_mappings:
-        failure_notes = f"Chat template type not supported: {request.chat_template_type}"
-        logger.error(failure_notes)
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-            return get_json_result(app.state.ns, request.hash)
+        # write into the next preallocated row so existing rows keep their
+        # positional index and nothing gets copied
+        leaderboard = reserve_capacity(leaderboard, state.n_active)
+        leaderboard.iloc[state.n_active] = [new_row[col] for col in leaderboard.columns]
+        publish_update(state, leaderboard, request.hash, new_row)
 
-    # check repo size of the model to see if it is within the limit
-    try:
-        model_repo_size = check_model_repo_size(request.hash, request.repo_namespace, request.repo_name)
-        if model_repo_size is None:
-            failure_notes = "Error checking model repo size. Make sure the model repository exists and is accessible."
+        # validate the request
+        if request.chat_template_type not in chat_template_mappings:
+            failure_notes = f"Chat template type not supported: {request.chat_template_type}"
             logger.error(failure_notes)
-            with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-                update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-                return get_json_result(app.state.ns, request.hash)
-    
-    except Exception as e:
-        failure_notes = f"Error checking model repo size: {e}"
-        logger.error(failure_notes)
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-            return get_json_result(app.state.ns, request.hash)
+            update_leaderboard_status(state, request.hash, "FAILED", failure_notes)
 
+        # repo and model size checks against the Hub happen in the worker service;
+        # the QUEUED row written above is the durable work queue and the handler
+        # returns as soon as it is enqueued
 
-    if model_repo_size > MAX_REPO_SIZE or model_repo_size < MIN_REPO_SIZE:
-        failure_notes = f"Model repo size is not up to requirments: {model_repo_size} bytes. Should be less than {MAX_REPO_SIZE} bytes and greater than {MIN_REPO_SIZE} bytes"
-        logger.error(failure_notes)
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-            return get_json_result(app.state.ns, request.hash)
-
-    # check model size by checking safetensors index
-    model_size = get_model_size(request.repo_namespace, request.repo_name)
-    if model_size is None:
-        failure_notes = "Error getting model size. Make sure the model.index.safetensors.json file exists in the model repository. And it has the metadata->total_size field."
-        logger.error(failure_notes)
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-            return get_json_result(app.state.ns, request.hash)
+        logger.info('returning result')
+        return get_json_result(state, request.hash)
 
-    if (model_size // 4) > MAX_MODEL_SIZE:
-        failure_notes = f"Model size is too large: {model_size} bytes. Should be less than {MAX_MODEL_SIZE} bytes"
-        logger.error(failure_notes)
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            update_leaderboard_status(app.state.ns, request.hash, "FAILED", failure_notes)
-            return get_json_result(app.state.ns, request.hash)
 
-    # Add the evaluation task to the queue
-    evaluation_queue.put(request)
+@app.post("/evaluate_model")
+async def evaluate_model(request: EvaluateModelRequest):
+    # the leaderboard sections take a blocking file lock and do disk IO, so they
+    # run on the threadpool instead of stalling the event loop
+    state = app.state.lb_state
+
+    # fast path: models already tracked return their cached status without any
+    # hash or Hub round-trips
+    current_status = await run_in_threadpool(tracked_model_status, state, request.hash)
+    if current_status is not None:
+        return current_status
 
-    logger.info('returning result')
-    with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-        return get_json_result(app.state.ns, request.hash)
+    # verify hash
+    if int(request.hash) != regenerate_hash(request.repo_namespace, request.repo_name, request.chat_template_type, request.competition_id):
+        raise HTTPException(status_code=400, detail="Hash does not match the model details")
 
+    return await run_in_threadpool(enqueue_model, state, request)
+
+
+# serialized /leaderboard payload, reused until the shared version advances
+_leaderboard_json_bytes = None
+_leaderboard_json_version = None
 
-def save_leaderboard_periodically(periodic_save_event, namespace):
-    while not periodic_save_event.is_set():
-        with ThreadSafeLeaderboardManager(namespace) as leaderboard:
-            logger.info("Saving leaderboard")
-            save_leaderboard(leaderboard)
-        
-        periodic_save_event.wait(SAVE_LEADERBOARD_EVERY)
-    
 
 @app.get("/leaderboard")
 def display_leaderboard():
-    with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-        return leaderboard.to_dict(orient='records')
-
-if __name__ == "__main__":
-    # add command line arguments for the ports of the two apis
-    import argparse
-    parser = argparse.ArgumentParser(description="Run the server")
-    parser.add_argument("--main-api-port", type=int, default=8000, help="Port for the main API")
-    parser.add_argument("--eval-score-port", type=int, default=8001, help="Port for the eval_score API")
-    parser.add_argument("--vibe-score-port", type=int, default=8002, help="Port for the vibe_score API")
-    parser.add_argument("--save-remote", action="store_true", default=False, help="Enable remote saving")
-    args = parser.parse_args()
-
-    MAIN_API_PORT = args.main_api_port
-    EVAL_SCORE_PORT = args.eval_score_port
-    VIBE_SCORE_PORT = args.vibe_score_port
-    # try:
-    #     multiprocessing.set_start_method('spawn', force=True) # need to fo
-    # except RuntimeError as e:
-    #     logger.warning(f"Warning: multiprocessing context has already been set. Details: {e}")
-    
-    evaluation_queue = multiprocessing.Queue()
-
-    SAVE_REMOTE = args.save_remote
+    global _leaderboard_json_bytes, _leaderboard_json_version
+    state = app.state.lb_state
+
+    if _leaderboard_json_bytes is not None and _leaderboard_json_version == state.version:
+        # nothing changed since the last request; skip the pandas -> JSON work entirely
+        return Response(content=_leaderboard_json_bytes, media_type="application/json")
+
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        # orjson serializes numpy scalars natively and maps NaN to null, but
+        # refuses datetime subclasses like pd.Timestamp, so those are passed
+        # through and formatted as ISO-8601 like the previous encoder did
+        records = state.active().to_dict(orient='records')
+        payload = orjson.dumps(
+            records,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+            default=lambda o: o.isoformat(),
+        )
+        _leaderboard_json_bytes = payload
+        _leaderboard_json_version = state.version
+
+    return Response(content=payload, media_type="application/json")
+
+def initialize_leaderboard_storage():
+    """
+    Create the Parquet snapshot on first run (migrating a legacy CSV snapshot if
+    one exists) and sanity-check its schema. Runs at import so the gunicorn
+    workers and the evaluation worker service can start in any order.
+    """
+    columns = ['hash', 'repo_namespace', 'repo_name', 'chat_template_type', 'revision', 'competition_id', 'model_size_score', 'qualitative_score', 'latency_score', 'vibe_score', 'total_score', 'timestamp', 'status', 'notes']
 
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_KEY")
+    lock_fh = app.state.lb_state.acquire()
     try:
-        supabase_client = create_client(supabase_url, supabase_key)
-    except Exception as e:
-        logger.warning(f"Failed to create Supabase client: {e}. Leaderboard will only be saved locally.")
-        supabase_client = None
-        SAVE_REMOTE = False
+        if not os.path.exists(leaderboard_file) and os.path.exists(leaderboard_legacy_csv_file):
+            # one-time migration from the old CSV snapshot
+            logger.info(f"Migrating {leaderboard_legacy_csv_file} to {leaderboard_file}")
+            dtype_dict = {
+                'hash': str,
+                'repo_namespace': str,
+                'repo_name': str,
+                'chat_template_type': str,
+                'model_size_score': 'float64',
+                'qualitative_score': 'float64',
+                'latency_score': 'float64',
+                'vibe_score': 'float64',
+                'total_score': 'float64',
+                'timestamp': str,
+                'status': str,
+                'notes': str
+            }
+            legacy_leaderboard = pd.read_csv(leaderboard_legacy_csv_file, dtype=dtype_dict, parse_dates=['timestamp'])
+            save_leaderboard(legacy_leaderboard)
+
+        if not os.path.exists(leaderboard_file):
+            save_leaderboard(pd.DataFrame(columns=columns))
+        else:
+            leaderboard = pd.read_parquet(leaderboard_file)
+
+            # backfill columns added after the snapshot was written
+            backfilled = False
+            for col, default in (('revision', 'main'), ('competition_id', 'd1')):
+                if col not in leaderboard.columns:
+                    leaderboard[col] = default
+                    backfilled = True
+            if backfilled:
+                save_leaderboard(leaderboard)
+                # drop the old-schema shared state so it gets rebuilt from the
+                # backfilled snapshot plus the WAL
+                if os.path.exists(leaderboard_state_file):
+                    os.remove(leaderboard_state_file)
 
-    
-    # Create a global shared namespace for the leaderboard
-    manager_instance = multiprocessing.Manager()
-    app.state.ns = manager_instance.Namespace()
-
-    # if the leaderboard file does not exist, create it with proper columns
-    columns = ['hash', 'repo_namespace', 'repo_name', 'chat_template_type', 'model_size_score', 'qualitative_score', 'latency_score', 'vibe_score', 'total_score', 'timestamp', 'status', 'notes']
-    if not os.path.exists(leaderboard_file):
-        # fetch from supabase
-        try:
-            leaderboard = pd.DataFrame(columns=columns)
-            leaderboard.to_csv(leaderboard_file, index=False)
-        
-        except Exception as e:
-            logger.error(f"Error fetching leaderboard from Supabase: {e}")
-            leaderboard = pd.DataFrame(columns=columns)
-            leaderboard.to_csv(leaderboard_file, index=False)
-    else:
-        # if the file exists, load it
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
             # check if the leaderboard has the correct columns
             if not all(col in leaderboard.columns for col in columns):
-                logger.error(f"Leaderboard file does not have the correct columns. Creating a new leaderboard file...")
-                # quit
+                logger.error(f"Leaderboard file does not have the correct columns.")
                 import sys
                 sys.exit(1)
-
-    try:
-        logger.info("Starting evaluation thread")
-        evaluation_process = multiprocessing.Process(target=model_evaluation_worker, args=(evaluation_queue, app.state.ns))
-        periodic_save_event = multiprocessing.Event()
-        periodic_save_process = multiprocessing.Process(target=save_leaderboard_periodically, args=(periodic_save_event, app.state.ns))
-        periodic_save_process.start()
-        evaluation_process.start()
-        logger.info("Starting API server")
-        uvicorn.run(app, host="0.0.0.0", port=MAIN_API_PORT)
-    except KeyboardInterrupt:
-        logger.info("Keyboard interrupt received, stopping...")
-    except Exception as e:
-        logger.error(f"An exception occurred: {e}")
     finally:
-        logger.info("Stopping evaluation thread")
-        # empty the queue
-        while not evaluation_queue.empty():
-            evaluation_queue.get()
-        
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            # remove any rows with status QUEUED
-            app.state.ns.leaderboard = leaderboard[leaderboard['status'] != 'QUEUED']
-            save_leaderboard(app.state.ns.leaderboard)
-
-        # stop the periodic save process
-        periodic_save_event.set()
-
-        # add a sentinel to the queue to stop the thread
-        evaluation_queue.put(None)
-
-        # wait for the evaluation thread to finish
-        evaluation_process.join()
-        # wait for the periodic save process to finish
-        periodic_save_process.join()
-
-        with ThreadSafeLeaderboardManager(app.state.ns) as leaderboard:
-            # remove any RUNNING status
-            app.state.ns.leaderboard = leaderboard[leaderboard['status'] != 'RUNNING']
-            save_leaderboard(app.state.ns.leaderboard)
-            logger.info("API server and evaluation thread have been stopped")
+        app.state.lb_state.release(lock_fh)
+
+
+# Shared leaderboard state for this process; gunicorn workers and the evaluation
+# worker service coordinate through the on-disk state files
+app.state.lb_state = LeaderboardState()
+initialize_leaderboard_storage()
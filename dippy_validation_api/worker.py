@@ -0,0 +1,130 @@
+"""
+Background worker for the validation API. Pulls QUEUED models off the
+leaderboard, runs the evaluation pipeline on them, and periodically compacts
+the WAL into the Parquet snapshot.
+
+Run this as a single sibling service next to the gunicorn workers
+(`python worker.py`); keeping it out of the API lifecycle means multiple
+gunicorn workers do not spawn duplicate evaluators.
+"""
+import gc
+import asyncio
+import multiprocessing
+
+import torch
+from fastapi.logger import logger
+
+from validation_api import (
+    SAVE_LEADERBOARD_EVERY,
+    EvaluateModelRequest,
+    LeaderboardState,
+    ThreadSafeLeaderboardManager,
+    compact_leaderboard,
+    evaluate_model_logic,
+    http_client,
+    update_leaderboard_status,
+)
+
+QUEUE_POLL_INTERVAL = 5  # seconds between checks for newly queued models
+
+
+def requeue_stale_running(state):
+    """
+    Evaluations interrupted by a previous worker shutdown are still marked
+    RUNNING; put them back in the queue so they get re-evaluated.
+    """
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        running = leaderboard['status'] == 'RUNNING'
+        if running.any():
+            logger.info(f"Requeueing {int(running.sum())} interrupted evaluations")
+            leaderboard.loc[running, 'status'] = 'QUEUED'
+            # the bulk status rewrite is not in the WAL, so publish it as a
+            # fresh snapshot
+            compact_leaderboard(state, leaderboard)
+
+
+def fetch_next_queued(state):
+    """
+    Claim the oldest QUEUED model and return it as an EvaluateModelRequest, or
+    None if the queue is empty. The claim marks the row RUNNING under the same
+    lock that found it, so several worker services can poll the queue in
+    parallel without double-claiming a job, and a claim survives crashes like
+    any other leaderboard update (WAL + snapshot).
+    """
+    with ThreadSafeLeaderboardManager(state) as leaderboard:
+        queued = leaderboard[leaderboard['status'] == 'QUEUED']
+        if queued.empty:
+            return None
+        # rows are appended in arrival order, so the first match is the oldest
+        row = queued.iloc[0]
+        update_leaderboard_status(state, row['hash'], 'RUNNING', 'Model evaluation in progress')
+        return EvaluateModelRequest(
+            repo_namespace=row['repo_namespace'],
+            repo_name=row['repo_name'],
+            chat_template_type=row['chat_template_type'],
+            hash=row['hash'],
+            revision=row['revision'],
+            competition_id=row['competition_id'],
+        )
+
+
+async def evaluation_loop(state):
+    try:
+        while True:
+            try:
+                request = fetch_next_queued(state)
+            except Exception as e:
+                # the claim did not land (e.g. the WAL append failed), so do not
+                # run the job; the row is still QUEUED and gets retried
+                logger.error(f"Error claiming queued model: {e}")
+                await asyncio.sleep(QUEUE_POLL_INTERVAL)
+                continue
+            if request is None:
+                await asyncio.sleep(QUEUE_POLL_INTERVAL)
+                continue
+            try:
+                with torch.no_grad():  # Disable gradient calculation
+                    result = await evaluate_model_logic(request, state)
+                    logger.info(f"Model evaluation completed: {result}")
+            except Exception as e:
+                logger.error(f"Error during model evaluation: {e}")
+            finally:
+                gc.collect()  # Garbage collect
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()  # Empty CUDA cache
+    finally:
+        # this process has no FastAPI shutdown event, so close the shared client here
+        await http_client.aclose()
+
+
+def save_leaderboard_periodically(periodic_save_event, state):
+    last_compacted_version = None
+    while not periodic_save_event.is_set():
+        # only rewrite the snapshot when something actually changed since the
+        # last compaction; an idle system does zero IO here
+        if state.version != last_compacted_version:
+            with ThreadSafeLeaderboardManager(state) as leaderboard:
+                logger.info("Compacting leaderboard WAL into snapshot")
+                compact_leaderboard(state, leaderboard)
+                last_compacted_version = state.version
+
+        periodic_save_event.wait(SAVE_LEADERBOARD_EVERY)
+
+
+if __name__ == "__main__":
+    state = LeaderboardState()
+    requeue_stale_running(state)
+
+    periodic_save_event = multiprocessing.Event()
+    periodic_save_process = multiprocessing.Process(target=save_leaderboard_periodically, args=(periodic_save_event, LeaderboardState()))
+    periodic_save_process.start()
+
+    try:
+        logger.info("Starting evaluation loop")
+        asyncio.run(evaluation_loop(state))
+    except KeyboardInterrupt:
+        logger.info("Keyboard interrupt received, stopping...")
+    finally:
+        periodic_save_event.set()
+        periodic_save_process.join()
+        logger.info("Evaluation worker stopped")
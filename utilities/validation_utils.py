@@ -4,10 +4,14 @@ import shutil
 import subprocess
 import time
 import requests
+from functools import lru_cache
 
 from transformers import AutoConfig, AutoModelForCausalLM
 
 
+# reuse one session for Hub requests so repeat lookups keep their connection alive
+session = requests.Session()
+
 
 def load_model_no_download(repo_namespace: str, repo_name: str):
     """
@@ -64,6 +68,7 @@ def parse_size(line):
         return 0
 
 
+@lru_cache(maxsize=4096)
 def check_model_repo_size(hash: int, repo_namespace: str, repo_name: str) -> int:
     """
     Check the size of a model hosted on Hugging Face using Git LFS without checking out the files,
@@ -108,15 +113,17 @@ def check_model_repo_size(hash: int, repo_namespace: str, repo_name: str) -> int
             shutil.rmtree(os.path.join(original_dir, repo_dir), ignore_errors=True)
 
 
+@lru_cache(maxsize=4096)
 def regenerate_hash(namespace, name, chat_template, competition_id):
     s = " ".join([namespace, name, chat_template, competition_id])
     hash_output = hashlib.sha256(s.encode('utf-8')).hexdigest()
     return int(hash_output[:16], 16)  # Returns a 64-bit integer from the first 16 hexadecimal characters
 
 
+@lru_cache(maxsize=4096)
 def get_model_size(repo_namespace: str, repo_name: str):
     safetensor_index = f"https://huggingface.co/{repo_namespace}/{repo_name}/resolve/main/model.safetensors.index.json"
-    response = requests.get(safetensor_index)
+    response = session.get(safetensor_index)
     if response.status_code != 200:
         print(f"Error getting safetensors index: {response.text}")
         return None